@@ -1,8 +1,16 @@
 import re
 import os
+import warnings
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
 import markdown
 
+try:
+    import numba # Optional: compiles the counting kernel below
+except ImportError:
+    numba = None
+
 """
 HTML Annotation Guidelines Generator
 
@@ -18,13 +26,343 @@ Note:
 - To include detection confidence information (useful for data analysis), call the function
   generate_guidelines with `guidelines_for_ds=True`:
       generate_guidelines(lang_code='fr', model_name='whisper', guidelines_for_ds=True)
+- To save the guidelines of every language/model pair at once, call generate_all_guidelines(output_dir).
 """
 
+# =============================
+# FORMAT INSTRUCTIONS
+# =============================
+
+# Map language codes to full names
+LANG_NAMES = {
+    "fr": "French",
+    "es": "Spanish",
+    "pt": "Portuguese",
+    "de": "German"
+}
+
+# Thousands separator: (separator character, separator name)
+THOUSAND_SEP_INSTR = {
+    "space": (" ", "space"),
+    "dot": (".", "dot"),
+    "comma": (",", "comma"),
+}
+THOUSAND_SEP_DEFAULT = THOUSAND_SEP_INSTR["dot"]
+
+PERCENT_INSTR = {
+    "symbol_no_space": "use digits with the % symbol attached to the number → 20% ✅, 20 % ❌, twenty percent ❌",
+    "symbol_space": "use digits with a space before the % symbol → 20 % ✅, 20% ❌, twenty percent ❌",
+    "word": "write the percentage in words → twenty percent ✅, 20% ❌",
+}
+PERCENT_DEFAULT = PERCENT_INSTR["symbol_no_space"]
+
+UNIT_INSTR = {
+    "short": "use abbreviations → 10 km ✅, 10 kilometers ❌",
+    "long": "use full words → 10 kilometers ✅, 10 km ❌",
+}
+UNIT_DEFAULT = UNIT_INSTR["long"]
+
+NUMBER_INSTR = {
+    "digit": "use digits → 100 ✅, one hundred ❌",
+    "word": "use written words → one hundred ✅, 100 ❌",
+}
+NUMBER_DEFAULT = "use written words for small numbers (<1000), digits for large numbers → ten ✅, 10 ❌; 1 234 ✅, one thousand two hundred thirty-four ❌"
+
+# Dates: (instruction, format shown in the special cases section)
+DATE_INSTR = {
+    "dd/mm/yyyy": ("use dd/mm/yyyy format → 10/02/2023 ✅, 10 february 2023 ❌", "dd/mm/yyyy"),
+    "yyyy-mm-dd": ("use ISO yyyy-mm-dd format → 2023-02-10 ✅, 10 february 2023 ❌", "yyyy-mm-dd"),
+    "dd_month_yyyy": ("use dd month yyyy format → 10 february 2023 ✅, 10/02/2023 ❌", "dd month yyyy"),
+}
+DATE_DEFAULT = DATE_INSTR["dd_month_yyyy"]
+
+CURRENCY_INSTR = {
+    "symbol": "use symbols → $ ✅, € ✅, dollars ❌, euros ❌",
+    "word": "use written words → dollars ✅, euros ✅, $ ❌, € ❌",
+}
+CURRENCY_DEFAULT = "format as heard"
+
+ORDINAL_INSTR = {
+    "digit_suffix": "use digits with suffix → 1st ✅, first ❌",
+    "word": "use written words → first ✅, 1st ❌",
+}
+ORDINAL_DEFAULT = "format as heard"
+
+# Model-specific spelling
+SPELLING_INSTR = {
+    "whisper": "Spell with spaces → d a n g",
+}
+SPELLING_DEFAULT = "Spell without spaces → dang"
+
+# Guidelines text, filled in by generate_guidelines
+GUIDELINES_TEMPLATE = """# {lang_name} Annotation Guidelines for {model_title}
+
+## 1. General Principles
+- Everything must be written in **lowercase**, **with accents**, except for proper nouns (Cardif).
+- **No punctuation**: ? ! : . , ; - _
+- Keep **spoken abbreviations/contractions**: gonna, gotta, etc.
+
+- **Personal data** (name, address, ID, SSN, passport, etc.) must be enclosed with #.
+      - Example: "Hello my name is #Jane Doe# my ID is 1 2 3#"
+
+- **Hesitations and non-speech sounds**: Put between <> expressions like "hm", "hmm", "euh", "eh", "ah"...
+      - Example: "I love euhhhh sandwich hmmm" → "I love &lt;euhhhh&gt; sandwich &lt;hmmm&gt;"
+      - Note: It does not matter if you put &lt;hm&gt; or &lt;hmmmmmmmmmmm&gt; we will normalize it.
+
+---
+
+{model_rules_section}
+
+---
+
+## 3. Special Cases
+- **Date format variations**: While the standard format is "{date_format_str}", if the speaker pronounces the date differently, transcribe it as heard.
+      - Examples of acceptable variations: "february 10", "10 de fevereiro de 2023"
+
+- **Incomplete words**: If a person does not finish a word, transcribe exactly what is heard.
+      - Example: If the speaker says "he has mar" instead of "he has marked", write "he has mar"
+
+- **Inaudible speech handling**:
+    - **Single inaudible segment**: Split the box to isolate [inaudible].
+        - Example: "Bonjour je m'appelle [inaudible] bye thanks for" → Box 1: "Bonjour je m'appelle", Box 2: "[inaudible]", Box 3: "bye thanks for"
+
+    - **Multiple inaudible segments**: Tag entire call as [inaudible].
+        - Example: "Bonjour [inaudible] je [inaudible] m'appelle [inaudible] bye [inaudible] thanks for" → [inaudible]
+
+"""
+
+# Appended to the guidelines when guidelines_for_ds=True
+DS_TEMPLATE = """
+---
+
+## 4. Detection Confidence
+- **Currency format**: {currency_confidence}
+- **Date format**: {date_confidence}
+- **Thousand separator**: {thousand_confidence}
+- **Percentage format**: {percent_confidence}
+- **Unit format**: {unit_confidence}
+- **Ordinal style**: {ordinal_confidence}
+- **Number style**: {number_confidence}
+"""
+
+
 # =============================
 # GUIDELINE GENERATION
 # =============================
 
-def get_aggregated_value(df, lang_code, model_name, column_name, default_values):
+# Convention columns and their default values
+DEFAULT_VALUES = {
+    "thousand_separator_format": "dot",
+    "percent_format": "symbol_no_space",
+    "unit_format": "long",
+    "date_format": "dd_month_yyyy",
+    "currency_format": "word",
+    "ordinal_style": "word",
+    "number_style": "digit"
+}
+
+# Column holding the confidence of each convention column ("unit_format" -> "unit_majority_pct")
+CONF_COLUMNS = {col: col.replace("_format", "_majority_pct").replace("_style", "_majority_pct") for col in DEFAULT_VALUES}
+
+LANG_CODE_PATTERN = re.compile(r"(?=_([a-z]{2})_)") # Lookahead so adjacent codes ("_fr_es_") are all found
+
+
+def find_language_codes(df):
+    """
+    Collects every language code appearing as "_xx_" in the file names, in one vectorized pass.
+    This defines the available languages, for generation and for the interactive menu alike.
+    """
+    return set(df["file"].str.extractall(LANG_CODE_PATTERN)[0].unique())
+
+
+NOT_DETECTED_CODE = -2 # Missing values keep the factorize code -1
+
+
+def count_codes(codes, members, n_values):
+    """
+    Counts the value codes of every column within every row group.
+
+    Args:
+    codes: Int array (rows x columns) of factorized values, -1 for missing, NOT_DETECTED_CODE for "not_detected"
+    members: Bool array (rows x groups) telling which groups each row belongs to
+    n_values: Number of distinct codes, i.e. the largest code + 1
+
+    Returns:
+    Tuple of (counts, first row of each value, rows with a detection), shaped
+    (columns x groups x values), (columns x groups x values) and (columns x groups)
+    """
+    n_rows, n_cols = codes.shape
+    n_groups = members.shape[1]
+    counts = np.zeros((n_cols, n_groups, n_values), np.int64)
+    first = np.full((n_cols, n_groups, n_values), n_rows, np.int64)
+    totals = np.zeros((n_cols, n_groups), np.int64)
+    rows = np.arange(n_rows)
+    for g in range(n_groups):
+        selected = members[:, g]
+        group_rows = rows[selected]
+        group_codes = codes[selected]
+        for c in range(n_cols):
+            col_codes = group_codes[:, c]
+            totals[c, g] = np.count_nonzero(col_codes != NOT_DETECTED_CODE)
+            present = col_codes >= 0
+            values = col_codes[present]
+            counts[c, g] = np.bincount(values, minlength=n_values)
+            uniques, first_index = np.unique(values, return_index=True)
+            first[c, g, uniques] = group_rows[present][first_index]
+    return counts, first, totals
+
+
+def count_codes_kernel(codes, members, n_values):
+    """
+    Same as count_codes, in one pass over the rows. Only fast once compiled with numba.
+    """
+    n_rows, n_cols = codes.shape
+    n_groups = members.shape[1]
+    counts = np.zeros((n_cols, n_groups, n_values), np.int64)
+    first = np.full((n_cols, n_groups, n_values), n_rows, np.int64)
+    totals = np.zeros((n_cols, n_groups), np.int64)
+    for i in range(n_rows):
+        for g in range(n_groups):
+            if not members[i, g]:
+                continue
+            for c in range(n_cols):
+                code = codes[i, c]
+                if code == NOT_DETECTED_CODE:
+                    continue
+                totals[c, g] += 1
+                if code >= 0:
+                    if counts[c, g, code] == 0:
+                        first[c, g, code] = i
+                    counts[c, g, code] += 1
+    return counts, first, totals
+
+
+count_codes_compiled = None # Set below when numba can compile count_codes_kernel
+
+if numba is not None:
+    # Explicit signature: compiled (or loaded from cache) at import rather than on the first call.
+    # Caching fails for code loaded without a file or module name (exec, unregistered spec
+    # loading), in which case the vectorized count_codes is used instead.
+    try:
+        count_codes_compiled = numba.njit(
+            "Tuple((int64[:, :, :], int64[:, :, :], int64[:, :]))(int64[:, :], boolean[:, :], int64)",
+            cache=True, nogil=True
+        )(count_codes_kernel)
+    except (ImportError, RuntimeError) as error: # No module name, or no cache locator for this file
+        warnings.warn(f"numba could not cache count_codes_kernel, using the vectorized count_codes: {error}")
+
+
+PACKED_MIN_ROWS = 250_000 # Below this size, packing the masks costs more than it saves
+
+
+def first_shared_row(mask_a, mask_b, packed=False):
+    """
+    Finds the first row selected by both masks, either boolean arrays or np.packbits bitmaps.
+
+    Returns:
+    Row index, or None if no row is selected by both
+    """
+    both = mask_a & mask_b
+    if not both.any():
+        return None
+    if not packed:
+        return int(np.argmax(both))
+    byte = int(np.argmax(both != 0))
+    return byte * 8 + int(np.argmax(np.unpackbits(both[byte:byte + 1])))
+
+
+# Fallback tiers, in order: (lookup table name, source reported with the value)
+FALLBACK_TIERS = (
+    ("language_model", "language_model"),
+    ("language", "language_majority"),
+    ("model", "model_majority"),
+    ("global", "global_majority"),
+)
+
+
+def build_aggregate_tables(df, lang_codes, columns=DEFAULT_VALUES):
+    """
+    Precomputes the values used by every fallback tier, for every language, model and column.
+
+    Each column is factorized once; every tier then reduces to counting integer codes
+    over the rows of a language, a model or the whole file, done by count_codes in one pass.
+
+    Args:
+    df: DataFrame with conventions data
+    lang_codes: Language codes to build tables for (matched as "_xx_" in file names)
+    columns: Convention columns to aggregate (keys of DEFAULT_VALUES)
+
+    Returns:
+    Dict of lookup tables by tier name (see FALLBACK_TIERS). Each maps a group key (language/model
+    pair, language, model, or None for global) to a dict of {column: (value, confidence)}
+    """
+    lang_masks = {
+        lang: df["file"].str.contains(f"_{lang}_", regex=False, na=False).to_numpy() # Plain substring test, no regex compilation
+        for lang in lang_codes
+    }
+    model_values = df["model"].to_numpy()
+    model_masks = {model: model_values == model for model in pd.unique(model_values)}
+
+    tables = {tier: {} for tier, _ in FALLBACK_TIERS}
+
+    # Tier 1: first row of each language/model pair, as long as it was detected
+    values_by_col = {col: df[col].to_numpy() for col in columns}
+    conf_by_col = {col: df[CONF_COLUMNS[col]].to_numpy() if CONF_COLUMNS[col] in df.columns else None for col in columns}
+    packed = len(df) >= PACKED_MIN_ROWS
+    if packed:
+        # Bit-packed masks: the pair ANDs below then touch one bit per row instead of one byte
+        pair_lang_masks = {lang: np.packbits(mask) for lang, mask in lang_masks.items()}
+        pair_model_masks = {model: np.packbits(mask) for model, mask in model_masks.items()}
+    else:
+        pair_lang_masks, pair_model_masks = lang_masks, model_masks
+    for lang, lang_mask in pair_lang_masks.items():
+        for model, model_mask in pair_model_masks.items():
+            first = first_shared_row(lang_mask, model_mask, packed)
+            if first is not None:
+                tables["language_model"][(lang, model)] = {}
+                for col in columns:
+                    value = values_by_col[col][first]
+                    if value != "not_detected":
+                        confidence = conf_by_col[col][first] if conf_by_col[col] is not None else 0.0
+                        tables["language_model"][(lang, model)][col] = (value, confidence)
+
+    # Tiers 2 to 4: majority values over languages, models and all data
+    groups = [("language", lang) for lang in lang_masks] + [("model", model) for model in model_masks] + [("global", None)]
+    members = np.column_stack([*lang_masks.values(), *model_masks.values(), np.ones(len(df), bool)])
+    codes = np.empty((len(df), len(columns)), np.int64)
+    uniques_by_col = []
+    for c, col in enumerate(columns):
+        codes[:, c], uniques = pd.factorize(df[col])
+        codes[(df[col] == "not_detected").to_numpy(), c] = NOT_DETECTED_CODE
+        uniques_by_col.append(uniques)
+
+    count = count_codes_compiled if count_codes_compiled is not None else count_codes
+    counts, first, totals = count(codes, members, max(map(len, uniques_by_col)))
+
+    for c, col in enumerate(columns):
+        for g, (tier, key) in enumerate(groups):
+            if not counts[c, g].any():
+                continue
+            best = np.lexsort((first[c, g], -counts[c, g]))[0] # Highest count first, then earliest appearance
+            tables[tier].setdefault(key, {})[col] = (uniques_by_col[c][best], counts[c, g, best] / totals[c, g])
+
+    return tables
+
+
+def get_fallback_tiers(tables, lang_code, model_name):
+    """
+    Selects the lookup tables of a language/model pair, in fallback order.
+    Tiers without any data are left out, so get_aggregated_value never visits them.
+
+    Returns:
+    List of (table, source) pairs, each table mapping a column to (value, confidence)
+    """
+    keys = {"language_model": (lang_code, model_name), "language": lang_code, "model": model_name, "global": None}
+    tiers = [(tables[tier].get(keys[tier]), source) for tier, source in FALLBACK_TIERS]
+    return [(table, source) for table, source in tiers if table]
+
+
+def get_aggregated_value(tiers, column_name, default_values):
     """
     Get value for a column with fallback aggregation rules.
 
@@ -36,217 +374,130 @@ def get_aggregated_value(df, lang_code, model_name, column_name, default_values)
     5. Default value
 
     Args:
-    df: DataFrame with conventions data
-    lang_code: Language code ('fr', 'es', 'pt', 'de')
-    model_name: Model name ('whisper', 'canary', 'parakeet')
+    tiers: Lookup tables from get_fallback_tiers
     column_name: Column to get value for
     default_values: Dict of default values by column
 
     Returns:
     Tuple of (value, confidence, source)
     """
-    # Filter for specific language and model
-    lang_model_filter = df["file"].str.contains(f"_{lang_code}_") & (df["model"] == model_name)
-    filtered = df[lang_model_filter]
-
-    if not filtered.empty and filtered[column_name].iloc[0] != "not_detected":
-        value = filtered[column_name].iloc[0]
-        conf_col = column_name.replace("_format", "_majority_pct").replace("_style", "_majority_pct")
-        confidence = filtered[conf_col].iloc[0] if conf_col in filtered.columns else 0.0
-        return value, confidence, "language_model"
-
-    # Fallback 1: Language majority (all models for this language)
-    lang_filter = df["file"].str.contains(f"_{lang_code}_")
-    lang_df = df[lang_filter]
-    if not lang_df.empty:
-        # Get most common non-"not_detected" value
-        lang_values = lang_df[column_name][lang_df[column_name] != "not_detected"]
-        if not lang_values.empty:
-            value_counts = lang_values.value_counts()
-            if not value_counts.empty:
-                value = value_counts.index[0]
-                # Calculate confidence as proportion of this value in language data
-                confidence = value_counts.iloc[0] / len(lang_values)
-                return value, confidence, "language_majority"
-
-    # Fallback 2: Model majority (all languages for this model)
-    model_filter = df["model"] == model_name
-    model_df = df[model_filter]
-    if not model_df.empty:
-        # Get most common non-"not_detected" value
-        model_values = model_df[column_name][model_df[column_name] != "not_detected"]
-        if not model_values.empty:
-            value_counts = model_values.value_counts()
-            if not value_counts.empty:
-                value = value_counts.index[0]
-                # Calculate confidence as proportion of this value in model data
-                confidence = value_counts.iloc[0] / len(model_values)
-                return value, confidence, "model_majority"
-
-    # Fallback 3: Global majority (all data)
-    global_values = df[column_name][df[column_name] != "not_detected"]
-    if not global_values.empty:
-        value_counts = global_values.value_counts()
-        if not value_counts.empty:
-            value = value_counts.index[0]
-            confidence = value_counts.iloc[0] / len(global_values)
-            return value, confidence, "global_majority"
-
-    # Fallback 4: Default value
+    for table, source in tiers:
+        if column_name in table:
+            value, confidence = table[column_name]
+            return value, confidence, source
+
+    # Default value
     default_value = default_values.get(column_name)
     return default_value, 0.0, "default"
 
 
+CATEGORY_MIN_BYTES = 256 * 1024 # Below this size, categorical parsing costs more than it saves
+
+
+def read_summary(file_path):
+    """
+    Reads the summary file.
+
+    Files over CATEGORY_MIN_BYTES are read with the model and convention columns as categoricals
+    (a handful of distinct values each, so comparisons run over integer codes), with pyarrow's
+    CSV parser when pyarrow is installed and pandas' default parser otherwise.
+    """
+    if os.path.getsize(file_path) <= CATEGORY_MIN_BYTES:
+        return pd.read_csv(file_path)
+
+    dtype = {col: "category" for col in ["model", *DEFAULT_VALUES]}
+    try:
+        return pd.read_csv(file_path, dtype=dtype, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(file_path, dtype=dtype)
+
+
+def prepare_state(file_path="model_conventions_summary.csv"):
+    """
+    Loads the summary file and precomputes everything shared by guideline generations.
+
+    Args:
+    file_path: Path of the summary file written by analyze()
+
+    Returns:
+    Dict with the DataFrame ("df"), its language codes ("languages") and aggregate
+    lookup tables ("tables"), or None if the summary file does not exist
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    df = read_summary(file_path)
+    languages = find_language_codes(df)
+
+    # Every fallback tier is precomputed in one pass over the data
+    return {"df": df, "languages": languages, "tables": build_aggregate_tables(df, languages)}
 
 
-def generate_guidelines(lang_code="fr", model_name="whisper", guidelines_for_ds=False):
+def generate_guidelines(lang_code="fr", model_name="whisper", guidelines_for_ds=False, state=None):
     """
     Generates specific annotation guidelines based on detected conventions.
 
     Args:
     lang_code : Language code ('fr', 'es', 'pt', 'de')
     model_name : Model name ('whisper', 'canary', 'parakeet')
+    state : Result of prepare_state(), to reuse across calls (loaded here if omitted)
 
     Returns:
     Formatted guidelines for the specified language and model
     """
 
-    if not os.path.exists("model_conventions_summary.csv"):
-        print("First run analyze() to generate the summary file.")
-        return ""
-
-    df = pd.read_csv("model_conventions_summary.csv")
+    if state is None:
+        state = prepare_state()
+        if state is None:
+            print("First run analyze() to generate the summary file.")
+            return ""
 
-    # Filter for specified language and model (for file and model name)
-    lang_filter = df["file"].str.contains(f"_{lang_code}_")
-    model_filter = df["model"] == model_name
-    filtered_df = df[lang_filter & model_filter]
+    tables = state["tables"]
+    if lang_code not in state["languages"]:
+        # Code not spelled "_xx_" in file names: aggregate for it on demand
+        tables = build_aggregate_tables(state["df"], {lang_code})
 
-    if filtered_df.empty:
+    if (lang_code, model_name) not in tables["language_model"]:
         print(f"No data found for language '{lang_code}' and model '{model_name}'")
         return ""
 
-    row = filtered_df.iloc[0]
-
-    # Default values
-    default_values = {
-        "thousand_separator_format": "dot",
-        "percent_format": "symbol_no_space",
-        "unit_format": "long",
-        "date_format": "dd_month_yyyy",
-        "currency_format": "word",
-        "ordinal_style": "word",
-        "number_style": "digit"
-    }
+    default_values = DEFAULT_VALUES
+    tiers = get_fallback_tiers(tables, lang_code, model_name)
 
     # Get values with fallback aggregation
     thousand_sep, thousand_conf, thousand_src = get_aggregated_value(
-        df, lang_code, model_name, "thousand_separator_format", default_values
+        tiers, "thousand_separator_format", default_values
     )
     percent_format, percent_conf, percent_src = get_aggregated_value(
-        df, lang_code, model_name, "percent_format", default_values
+        tiers, "percent_format", default_values
     )
     unit_format, unit_conf, unit_src = get_aggregated_value(
-        df, lang_code, model_name, "unit_format", default_values
+        tiers, "unit_format", default_values
     )
     date_format, date_conf, date_src = get_aggregated_value(
-        df, lang_code, model_name, "date_format", default_values
+        tiers, "date_format", default_values
     )
     currency_format, currency_conf, currency_src = get_aggregated_value(
-        df, lang_code, model_name, "currency_format", default_values
+        tiers, "currency_format", default_values
     )
     ordinal_style, ordinal_conf, ordinal_src = get_aggregated_value(
-        df, lang_code, model_name, "ordinal_style", default_values
+        tiers, "ordinal_style", default_values
     )
     number_style, number_conf, number_src = get_aggregated_value(
-        df, lang_code, model_name, "number_style", default_values
+        tiers, "number_style", default_values
     )
 
-    # Map language codes to full names
-    lang_names = {
-        "fr": "French",
-        "es": "Spanish",
-        "pt": "Portuguese",
-        "de": "German"
-    }
-
-    lang_name = lang_names.get(lang_code, lang_code.upper())
-
-    # Format thousands separator instructions
-    if thousand_sep == "space":
-        sep_char = " "
-        sep_name = "space"
-    elif thousand_sep == "dot":
-        sep_char = "."
-        sep_name = "dot"
-    elif thousand_sep == "comma":
-        sep_char = ","
-        sep_name = "comma"
-    else:
-        sep_char = "."
-        sep_name = "dot"
-
-    # Format percentages instruction
-    if percent_format == "symbol_no_space":
-        percent_instruction = "use digits with the % symbol attached to the number → 20% ✅, 20 % ❌, twenty percent ❌"
-    elif percent_format == "symbol_space":
-        percent_instruction = "use digits with a space before the % symbol → 20 % ✅, 20% ❌, twenty percent ❌"
-    elif percent_format == "word":
-        percent_instruction = "write the percentage in words → twenty percent ✅, 20% ❌"
-    else:
-        percent_instruction = "use digits with the % symbol attached to the number → 20% ✅, 20 % ❌, twenty percent ❌"
+    lang_name = LANG_NAMES.get(lang_code, lang_code.upper())
 
-    # Format units instruction
-    if unit_format == "short":
-        unit_instruction = "use abbreviations → 10 km ✅, 10 kilometers ❌"
-    elif unit_format == "long":
-        unit_instruction = "use full words → 10 kilometers ✅, 10 km ❌"
-    else:
-        unit_instruction = "use full words → 10 kilometers ✅, 10 km ❌"
-
-    # Format numbers instruction
-    if number_style == "digit":
-        number_instruction = "use digits → 100 ✅, one hundred ❌"
-    elif number_style == "word":
-        number_instruction = "use written words → one hundred ✅, 100 ❌"
-    else:
-        number_instruction = "use written words for small numbers (<1000), digits for large numbers → ten ✅, 10 ❌; 1 234 ✅, one thousand two hundred thirty-four ❌"
-
-    # Format dates instruction
-    if date_format == "dd/mm/yyyy":
-        date_instruction = f"use dd/mm/yyyy format → 10/02/2023 ✅, 10 february 2023 ❌"
-        date_format_str = "dd/mm/yyyy"
-    elif date_format == "yyyy-mm-dd":
-        date_instruction = f"use ISO yyyy-mm-dd format → 2023-02-10 ✅, 10 february 2023 ❌"
-        date_format_str = "yyyy-mm-dd"
-    elif date_format == "dd_month_yyyy":
-        date_instruction = f"use dd month yyyy format → 10 february 2023 ✅, 10/02/2023 ❌"
-        date_format_str = "dd month yyyy"
-    else:
-        date_instruction = f"use dd month yyyy format → 10 february 2023 ✅, 10/02/2023 ❌"
-        date_format_str = "dd month yyyy"
-
-    # Format currency instruction
-    if currency_format == "symbol":
-        currency_instruction = "use symbols → $ ✅, € ✅, dollars ❌, euros ❌"
-    elif currency_format == "word":
-        currency_instruction = "use written words → dollars ✅, euros ✅, $ ❌, € ❌"
-    else:
-        currency_instruction = "format as heard"
-
-    # Format ordinal instruction
-    if ordinal_style == "digit_suffix":
-        ordinal_instruction = "use digits with suffix → 1st ✅, first ❌"
-    elif ordinal_style == "word":
-        ordinal_instruction = "use written words → first ✅, 1st ❌"
-    else:
-        ordinal_instruction = "format as heard"
-
-    # Model-specific spelling
-    if model_name == "whisper":
-        spelling_instruction = "Spell with spaces → d a n g"
-    else:
-        spelling_instruction = "Spell without spaces → dang"
+    # Look up the instruction of each detected format
+    sep_char, sep_name = THOUSAND_SEP_INSTR.get(thousand_sep, THOUSAND_SEP_DEFAULT)
+    percent_instruction = PERCENT_INSTR.get(percent_format, PERCENT_DEFAULT)
+    unit_instruction = UNIT_INSTR.get(unit_format, UNIT_DEFAULT)
+    number_instruction = NUMBER_INSTR.get(number_style, NUMBER_DEFAULT)
+    date_instruction, date_format_str = DATE_INSTR.get(date_format, DATE_DEFAULT)
+    currency_instruction = CURRENCY_INSTR.get(currency_format, CURRENCY_DEFAULT)
+    ordinal_instruction = ORDINAL_INSTR.get(ordinal_style, ORDINAL_DEFAULT)
+    spelling_instruction = SPELLING_INSTR.get(model_name, SPELLING_DEFAULT)
 
 
     # Helper function for confidence display
@@ -298,60 +549,111 @@ def generate_guidelines(lang_code="fr", model_name="whisper", guidelines_for_ds=
 
 
     # Generate guidelines
-    guidelines = f"""# {lang_name} Annotation Guidelines for {model_name.capitalize()}
+    params = {
+        "lang_name": lang_name,
+        "model_title": model_name.capitalize(),
+        "model_rules_section": model_rules_section,
+        "date_format_str": date_format_str,
+    }
+    guidelines = GUIDELINES_TEMPLATE.format_map(params)
+
+    if guidelines_for_ds :
+        params.update({
+            "currency_confidence": format_confidence(currency_format, currency_conf, currency_src),
+            "date_confidence": format_confidence(date_format, date_conf, date_src),
+            "thousand_confidence": format_confidence(thousand_sep, thousand_conf, thousand_src),
+            "percent_confidence": format_confidence(percent_format, percent_conf, percent_src),
+            "unit_confidence": format_confidence(unit_format, unit_conf, unit_src),
+            "ordinal_confidence": format_confidence(ordinal_style, ordinal_conf, ordinal_src),
+            "number_confidence": format_confidence(number_style, number_conf, number_src),
+        })
+        return guidelines + DS_TEMPLATE.format_map(params)
+    else :
+        return guidelines
 
-## 1. General Principles
-- Everything must be written in **lowercase**, **with accents**, except for proper nouns (Cardif).
-- **No punctuation**: ? ! : . , ; - _
-- Keep **spoken abbreviations/contractions**: gonna, gotta, etc.
 
-- **Personal data** (name, address, ID, SSN, passport, etc.) must be enclosed with #.
-      - Example: "Hello my name is #Jane Doe# my ID is 1 2 3#"
+# =============================
+# BATCH GENERATION
+# =============================
 
-- **Hesitations and non-speech sounds**: Put between <> expressions like "hm", "hmm", "euh", "eh", "ah"...
-      - Example: "I love euhhhh sandwich hmmm" → "I love &lt;euhhhh&gt; sandwich &lt;hmmm&gt;"
-      - Note: It does not matter if you put &lt;hm&gt; or &lt;hmmmmmmmmmmm&gt; we will normalize it.
+PARALLEL_MIN_COMBINATIONS = 32 # Below this count, starting worker processes costs more than it saves
 
----
+worker_state = None # State shared by the guideline workers, set once per process
 
-{model_rules_section}
 
----
+def init_worker(state):
+    global worker_state
+    worker_state = state
 
-## 3. Special Cases
-- **Date format variations**: While the standard format is "{date_format_str}", if the speaker pronounces the date differently, transcribe it as heard.
-      - Examples of acceptable variations: "february 10", "10 de fevereiro de 2023"
 
-- **Incomplete words**: If a person does not finish a word, transcribe exactly what is heard.
-      - Example: If the speaker says "he has mar" instead of "he has marked", write "he has mar"
+def generate_combination(args):
+    """
+    Generates the guidelines of one (lang_code, model_name, guidelines_for_ds) combination
+    from the worker state.
+    """
+    lang_code, model_name, guidelines_for_ds = args
+    return generate_guidelines(lang_code, model_name, guidelines_for_ds, state=worker_state)
 
-- **Inaudible speech handling**:
-    - **Single inaudible segment**: Split the box to isolate [inaudible].
-        - Example: "Bonjour je m'appelle [inaudible] bye thanks for" → Box 1: "Bonjour je m'appelle", Box 2: "[inaudible]", Box 3: "bye thanks for"
 
-    - **Multiple inaudible segments**: Tag entire call as [inaudible].
-        - Example: "Bonjour [inaudible] je [inaudible] m'appelle [inaudible] bye [inaudible] thanks for" → [inaudible]
+def generate_all_guidelines(output_dir=".", guidelines_for_ds=True, state=None):
+    """
+    Generates the guidelines of every language/model pair found in the summary file and saves
+    each one to "<output_dir>/Annotation Guidelines - <Language>/guidelines_<lang>_<model>.txt".
+    Combinations are independent, so many of them are spread over a process pool.
 
-"""
+    Args:
+    output_dir : Directory receiving one sub-folder per language
+    guidelines_for_ds : Whether to include the detection confidence section
+    state : Result of prepare_state(), loaded here if omitted
 
+    Returns:
+    List of the written file paths
+    """
+    if state is None:
+        state = prepare_state()
+        if state is None:
+            print("First run analyze() to generate the summary file.")
+            return []
+
+    models = sorted(state["df"]["model"].dropna().unique())
+    combinations = [
+        (lang_code, model_name, guidelines_for_ds)
+        for lang_code in sorted(state["languages"])
+        for model_name in models
+        if (lang_code, model_name) in state["tables"]["language_model"]
+    ]
 
-    guidelines_ds = guidelines + f"""
----
+    if len(combinations) < PARALLEL_MIN_COMBINATIONS:
+        init_worker(state)
+        results = [generate_combination(c) for c in combinations]
+    else:
+        with Pool(initializer=init_worker, initargs=(state,)) as pool:
+            results = pool.map(generate_combination, combinations)
+
+    outputs = [
+        (os.path.join(
+            output_dir,
+            f"Annotation Guidelines - {LANG_NAMES.get(lang_code, lang_code.upper())}",
+            f"guidelines_{lang_code}_{model_name}.txt"
+        ), guidelines)
+        for (lang_code, model_name, _), guidelines in zip(combinations, results)
+        if guidelines
+    ]
 
-## 4. Detection Confidence
-- **Currency format**: {format_confidence(currency_format, currency_conf, currency_src)}
-- **Date format**: {format_confidence(date_format, date_conf, date_src)}
-- **Thousand separator**: {format_confidence(thousand_sep, thousand_conf, thousand_src)}
-- **Percentage format**: {format_confidence(percent_format, percent_conf, percent_src)}
-- **Unit format**: {format_confidence(unit_format, unit_conf, unit_src)}
-- **Ordinal style**: {format_confidence(ordinal_style, ordinal_conf, ordinal_src)}
-- **Number style**: {format_confidence(number_style, number_conf, number_src)}
-"""
+    # Write every file first, then report them all with a single print
+    report = []
+    for lang_dir in {os.path.dirname(file_path) for file_path, _ in outputs}:
+        os.makedirs(lang_dir, exist_ok=True)
+    for file_path, guidelines in outputs:
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(guidelines)
+        report.append(f"Saved {file_path}")
+        report.extend(guidelines.split("\n", 5)[:5])
+        report.append("...")
+    if report:
+        print("\n".join(report))
 
-    if guidelines_for_ds : 
-        return guidelines_ds
-    else :
-        return guidelines
+    return [file_path for file_path, _ in outputs]
 
 
 # =============================
@@ -368,7 +670,8 @@ if __name__ == "__main__":
         # print(f"Running analysis to generate {filename}...")
         # analyze()
         
-    df = pd.read_csv(file_path)
+    state = prepare_state(file_path)
+    df = state["df"]
 
     language_map = {
         "fr": ["fr", "french", "francais", "français"],
@@ -385,16 +688,12 @@ if __name__ == "__main__":
     }
 
     # Detect available languages
-    available_languages = set()
-    for file in df["file"].unique():
-        match = re.search(r'_([a-z]{2})_', file)
-        if match:
-            available_languages.add(match.group(1))
+    available_languages = sorted(state["languages"])
 
-    available_models = sorted(df["model"].unique())
+    available_models = np.unique(df["model"].dropna().to_numpy()).tolist()
 
     print("\nAvailable languages:")
-    for lang in sorted(available_languages):
+    for lang in available_languages:
         print(f" - {language_display.get(lang, lang)} ({lang})")
 
     print("\nAvailable models:", ", ".join(available_models))
@@ -423,7 +722,7 @@ if __name__ == "__main__":
         exit()
 
     # Generate markdown guidelines
-    guidelines_md = generate_guidelines(lang_code=lang_code, model_name=model_name)
+    guidelines_md = generate_guidelines(lang_code=lang_code, model_name=model_name, state=state)
 
     if not guidelines_md:
         print("No guidelines generated.")
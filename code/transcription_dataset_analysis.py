@@ -2,9 +2,18 @@ import re
 import os
 import glob
 import unicodedata
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from collections import Counter
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from functools import lru_cache
+from multiprocessing import Pool
+
+try:
+    import hyperscan # Optional: enables the single-pass prefilter below
+except ImportError:
+    hyperscan = None
 
 """
 Transcription Dataset Analysis
@@ -26,18 +35,32 @@ Note:
 # TEXT NORMALIZATION
 # =============================
 
+NORMALIZE_CACHE_MAX_LEN = 1024 # Longer texts are rarely repeated and would bloat the cache
+
 def normalize(text):
     """
     Normalizes text by handling missing values, Unicode normalization,
     and whitespace standardization.
     """
-    if pd.isna(text):
-        return ""
-    text = str(text)
+    if not isinstance(text, str): # Strings skip the comparatively slow pd.isna dispatch
+        if pd.isna(text):
+            return ""
+        text = str(text)
+    if len(text) <= NORMALIZE_CACHE_MAX_LEN:
+        return normalize_string_cached(text)
+    return normalize_string(text)
+
+def normalize_string(text):
+    """
+    Unicode (NFKC) and whitespace normalization of a non-missing string.
+    """
     text = unicodedata.normalize("NFKC", text)
     text = text.replace("\u00A0", " ")
     return text.strip()
 
+# The same transcription often appears in several model columns and files, so short strings are normalized once
+normalize_string_cached = lru_cache(maxsize=100_000)(normalize_string)
+
 # =============================
 # LEXICONS
 # =============================
@@ -63,7 +86,7 @@ ORDINAL_WORDS = set([
     "erste","zweite","dritte","vierte","fünfte","sechste","siebte","achte","neunte","zehnte","elfte","zwölfte","dreizehnte","vierzehnte","fünfzehnte","sechzehnte","zwanzigste","dreißigste","vierzigste","fünfzigste","hundertste","tausendste"
 ])
 
-CURRENCY_WORDS = [
+CURRENCY_WORDS = frozenset([
     "euro", "euros", "dollar", "dollars", "dólar", "dólares",
     "livre", "livres", "libra", "libras", "pfund",
     "yen", "yens", "yenes", "iene", "ienes",
@@ -74,11 +97,11 @@ CURRENCY_WORDS = [
     "real", "reais", "reales",
     "sol", "soles", "quetzal", "quetzales",
     "colón", "colones", "bolívar", "bolívares"
-]
+])
 
 UNIT_SHORT = ["km","m","cm","mm","kg","hg","g","mg","l","ml","h","min","s","°c"]
 
-UNIT_LONG = [
+UNIT_LONG = frozenset([
     "kilomètre", "kilometre", "kilómetro", "kilometer", "quilómetro",
     "mètre", "metro", "meter", "metre",
     "centimètre", "centimetro", "zentimeter", "centímetro",
@@ -99,21 +122,44 @@ UNIT_LONG = [
     "heure", "hora", "stunde", "hour",
 
     "degré celsius", "grado celsius", "grad celsius", "grau celsius", "celsius",
-]
+])
 
-MONTH_WORDS = [
+MONTH_WORDS = frozenset([
     "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
     "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
     "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
     "januar","februar","märz","maerz","april","mai","juni","juli","august","september","oktober","november","dezember"
-]
+])  # Shared spellings across languages (e.g. "abril", "agosto", "mai") are deduplicated by the set
 
-HESITATIONS = ["euh","eh","ehm","hmm","hm","ah","uh","um","äh","mmm"]
+HESITATIONS = frozenset(["euh","eh","ehm","hmm","hm","ah","uh","um","äh","mmm"])
 
 
 # ===============================
 # STRUCTURAL REGULAR EXPRESSIONS
 # ===============================
+# Patterns containing words are matched against lowercased text (see detect_normalized),
+# so they are compiled without re.I and skip per-character case folding.
+# They rely on the standard library engine: RE2 bindings treat accented letters as word boundaries
+# ("édix" would match \bdix\b).
+
+def build_alternation(words):
+    """
+    Joins a lexicon into a regex alternation grouped by leading character,
+    e.g. {"deux", "dix", "trois"} -> "d(?:eux|ix)|t(?:rois)".
+    The regex engine then rejects a position after one character test per group instead of
+    trying every word; within a group, longest words come first so that multi-word entries
+    ("mil millones") win over their prefixes ("mil").
+    """
+    groups = defaultdict(list)
+    for word in words:
+        groups[word[0].lower()].append(word[1:])
+    return "|".join(
+        first + "(?:" + "|".join(sorted(rests, key=lambda w: (-len(w), w))) + ")"
+        for first, rests in sorted(groups.items())
+    )
+
+# Any digit: every date and thousand-separator pattern needs one
+RE_DIGIT = re.compile(r"\d")
 
 # Thousand separators
 RE_THOUSAND_SPACE = re.compile(r"\b\d{1,3}( \d{3})+\b")  # Matches: "1 000", "12 345", "999 999 999"
@@ -123,43 +169,126 @@ RE_THOUSAND_COMMA = re.compile(r"\b\d{1,3}(,\d{3})+\b") # Matches: "1,000", "12,
 # Percentage formats
 RE_PERCENT_SPACE = re.compile(r"\d+ %") # Matches: "50 %", "100 %", "12.5 %"
 RE_PERCENT_NO_SPACE = re.compile(r"\d+%") # Matches: "50%", "100%", "12.5%"
-RE_PERCENT_WORD = re.compile(r"\b(pour cent|por ciento|por cento|prozent)\b", re.I) # Matches: "pour cent", "POR CIENTO", "Prozent"
+RE_PERCENT_WORD = re.compile(r"\b(pour cent|por ciento|por cento|prozent)\b") # Matches: "pour cent", "por ciento", "prozent"
 
 # Ordinal number patterns
-RE_ORDINAL_DIGIT = re.compile(r"\d+(e|ème|º|ª|th|st|nd|rd)\b", re.I) # Matches: "1er", "2ème", "3rd"
-RE_ORDINAL_WORD = re.compile( r"\b(" + "|".join(ORDINAL_WORDS) + r")(e|es|s|a|as|er)?\b", re.I)  # Matches: "premier", "Second", "TROISIÈME" (with optional gender/number suffixes)
+RE_ORDINAL_DIGIT = re.compile(r"\d+(e|ème|º|ª|th|st|nd|rd)\b") # Matches: "1er", "2ème", "3rd"
+RE_ORDINAL_WORD = re.compile( r"\b(" + build_alternation(ORDINAL_WORDS) + r")(e|es|s|a|as|er)?\b")  # Matches: "premier", "second", "troisième" (with optional gender/number suffixes)
 
 # Text style patterns
 RE_PUNCT = re.compile(r"[,;:!?-_.]")
 
 # Number and unit patterns
 RE_DIGIT_NUMBER = r"\d+(?:[.,]\d+)?"
-RE_WORD_NUMBER = r"\b(" + "|".join(NUMBER_WORDS) + r")\b"
+RE_WORD_NUMBER = r"\b(" + build_alternation(NUMBER_WORDS) + r")\b"
 RE_QUANTITY = rf"(?:{RE_DIGIT_NUMBER}|{RE_WORD_NUMBER})"
+RE_NUMBER_OR_WORD = re.compile(rf"(\d+)|{RE_WORD_NUMBER}") # Matches digit runs ("42") or number words ("dix"), counted in one pass
 
 # Unit patterns
-RE_UNIT_WITH_QUANTITY = re.compile( rf"{RE_QUANTITY}\s*\b({'|'.join(UNIT_SHORT)})\b", re.I ) # Matches: "5 g", "10,5ml", "dos litros"
+RE_UNIT_WITH_QUANTITY = re.compile( rf"{RE_QUANTITY}\s*\b({'|'.join(UNIT_SHORT)})\b") # Matches: "5 g", "10,5ml", "dos litros"
                                                                                              # short units only when preceded by a quantity to avoid false positives like "Super G"
-RE_UNIT_LONG = re.compile(r"\b(" + "|".join(UNIT_LONG) + r")(s|es|en)?\b",  re.I)  # Matches: "gramme", "kilogrammes" (with optional plural suffixes)
+RE_UNIT_LONG = re.compile(r"\b(" + build_alternation(UNIT_LONG) + r")(s|es|en)?\b")  # Matches: "gramme", "kilogrammes" (with optional plural suffixes)
 
 # Currency patterns
 RE_CURRENCY_SYMBOL = re.compile(r"[€$£¥₹₽₺¢₩]")
-RE_CURRENCY_WORD = r"\b(" + "|".join(CURRENCY_WORDS) + r")\b"
-RE_CURRENCY_PATTERN = re.compile( rf"{RE_QUANTITY}\s*{RE_CURRENCY_WORD}", re.I) # Matches: "5 euros", "cinco pesos"
+RE_CURRENCY_WORD = r"\b(" + build_alternation(CURRENCY_WORDS) + r")\b"
+RE_CURRENCY_PATTERN = re.compile( rf"{RE_QUANTITY}\s*{RE_CURRENCY_WORD}") # Matches: "5 euros", "cinco pesos"
                                                                                 # Only matches currency words that follow a number/quantity
                                                                                 # This ensures we capture monetary amounts, not text containing currency words in other contexts (e.g. "vida real")
 # Date patterns
 RE_DATE_DD_MM_YYYY = re.compile( r"\b(?:0?[1-9]|[12][0-9]|3[01])[/.](?:0?[1-9]|1[0-2])[/.]\d{4}\b" ) # Matches: "25/11/2024", "5/6/2023", "31.01.1887"
 RE_DATE_YYYY_MM_DD = re.compile( r"\b\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12][0-9]|3[01])\b" ) # Matches: "2024-11-25", "2024-06-05", "1887-01-31"
-RE_DATE_DD_MONTH_YYYY = re.compile( r"\b(?:0?[1-9]|[12][0-9]|3[01])\s+(" + "|".join(MONTH_WORDS) + r")\s+\d{4}\b", re.I) # Matches: "25 décembre 2023", "5 juin 2024", "31 janvier 2025"
+RE_DATE_DD_MONTH_YYYY = re.compile( r"\b(?:0?[1-9]|[12][0-9]|3[01])\s+(" + build_alternation(MONTH_WORDS) + r")\s+\d{4}\b") # Matches: "25 décembre 2023", "5 juin 2024", "31 janvier 2025"
 
 
 # Hesitation patterns
-HESITATION_PATTERNS = []
-for hesitation in HESITATIONS:
-    pattern = r"\b" + r"+".join(re.escape(c) for c in hesitation) + r"+\b"
-    HESITATION_PATTERNS.append(pattern)
-RE_HESITATION_PATTERN = re.compile("|".join(HESITATION_PATTERNS), re.I) # Matches: "euuuuh","eh","ehmmm", etc
+RE_HESITATION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(
+        r"+".join(re.escape(c) for c in hesitation) + "+"  # Each letter may be stretched: "euh" -> "e+u+h+"
+        for hesitation in sorted(HESITATIONS, key=lambda w: (-len(w), w))
+    ) + r")\b",
+) # Matches: "euuuuh","eh","ehmmm", etc
+
+
+# Modes of each feature category, from highest to lowest priority: (name, pattern)
+PERCENT_MODES = (
+    ("symbol_space", RE_PERCENT_SPACE),
+    ("symbol_no_space", RE_PERCENT_NO_SPACE),
+    ("word", RE_PERCENT_WORD),
+)
+CURRENCY_MODES = (
+    ("symbol", RE_CURRENCY_SYMBOL),
+    ("word", RE_CURRENCY_PATTERN),
+)
+THOUSAND_SEP_MODES = (
+    ("space", RE_THOUSAND_SPACE),
+    ("dot", RE_THOUSAND_DOT),
+    ("comma", RE_THOUSAND_COMMA),
+)
+UNIT_MODES = (
+    ("short", RE_UNIT_WITH_QUANTITY),
+    ("long", RE_UNIT_LONG),
+)
+DATE_FORMATS = (
+    ("dd/mm/yyyy", RE_DATE_DD_MM_YYYY),
+    ("yyyy-mm-dd", RE_DATE_YYYY_MM_DD),
+    ("dd_month_yyyy", RE_DATE_DD_MONTH_YYYY),
+)
+
+
+# Hyperscan prefilter (one scan per text for all categories)
+FEATURE_PATTERNS = {
+    "percent": [RE_PERCENT_SPACE, RE_PERCENT_NO_SPACE, RE_PERCENT_WORD],
+    "currency": [RE_CURRENCY_SYMBOL, RE_CURRENCY_PATTERN],
+    "thousand_sep": [RE_THOUSAND_SPACE, RE_THOUSAND_DOT, RE_THOUSAND_COMMA],
+    "unit": [RE_UNIT_WITH_QUANTITY, RE_UNIT_LONG],
+    "ordinal": [RE_ORDINAL_DIGIT, RE_ORDINAL_WORD],
+    "number": [RE_NUMBER_OR_WORD],
+    "hesitation": [RE_HESITATION_PATTERN],
+    "date": [RE_DATE_DD_MM_YYYY, RE_DATE_YYYY_MM_DD, RE_DATE_DD_MONTH_YYYY],
+}
+ALL_FEATURES = frozenset(FEATURE_PATTERNS)
+
+@lru_cache(maxsize=None)
+def build_prefilter():
+    """
+    Compiles every feature pattern into a single Hyperscan database.
+    Built on first use (once per process), so importing this module and starting
+    pool workers stay cheap.
+
+    Hyperscan does not support Unicode word boundaries, so patterns are compiled in
+    prefilter mode: a reported category may still fail the exact `re` check, but a
+    category that is not reported cannot match. The `re` patterns remain the reference.
+
+    Returns: (database, scratch, category names by id), or None if hyperscan is not installed
+    """
+    if hyperscan is None:
+        return None
+    categories = list(FEATURE_PATTERNS)
+    expressions, ids = [], []
+    for category_id, category in enumerate(categories):
+        for regex in FEATURE_PATTERNS[category]:
+            expressions.append(regex.pattern.encode("utf-8"))
+            ids.append(category_id)
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER
+    database = hyperscan.Database()
+    database.compile(expressions=expressions, ids=ids, flags=[flags] * len(expressions))
+    return database, hyperscan.Scratch(database), categories
+
+def candidate_features(text):
+    """
+    Returns the feature categories whose patterns may match the (lowercased) text.
+    Without hyperscan, every category is a candidate.
+    """
+    prefilter = build_prefilter()
+    if prefilter is None:
+        return ALL_FEATURES
+    database, scratch, categories = prefilter
+    found = set()
+    def on_match(category_id, start, end, flags, context):
+        found.add(categories[category_id])
+    database.scan(text.encode("utf-8", "replace"), match_event_handler=on_match, scratch=scratch)
+    return found
 
 
 # ===================================
@@ -181,72 +310,74 @@ def detect(text):
     - Hesitation markers
     - Punctuation and capitalization patterns
     """
+    return dict(detect_normalized(normalize(text))) # Copy so callers never mutate the cached result
+
 
-    text = normalize(text)
+@lru_cache(maxsize=200_000)
+def detect_normalized(text):
+    """
+    Cached implementation of detect() for already normalized text.
+    Transcriptions repeat often (short answers, fillers, empty rows), so identical texts are analyzed only once.
+    """
     feats = {}
+    lowered = text.lower() # Matched by all word patterns; the original text is kept for the style metrics
+    has_digit = bool(RE_DIGIT.search(text))
+    candidates = candidate_features(lowered) # Categories that cannot match are skipped below
 
     # percentage detection
-    if RE_PERCENT_SPACE.search(text):
-        feats["percent_mode"] = "symbol_space"
-    elif RE_PERCENT_NO_SPACE.search(text):
-        feats["percent_mode"] = "symbol_no_space"
-    elif RE_PERCENT_WORD.search(text):
-        feats["percent_mode"] = "word"
-    else:
-        feats["percent_mode"] = None
+    feats["percent_mode"] = detect_mode(PERCENT_MODES, lowered) if "percent" in candidates else None
 
     # currency detection
-    if RE_CURRENCY_SYMBOL.search(text):
-        feats["currency_mode"] = "symbol"
-    elif RE_CURRENCY_PATTERN.search(text):
-        feats["currency_mode"] = "word"
-    else:
-        feats["currency_mode"] = None
+    feats["currency_mode"] = detect_mode(CURRENCY_MODES, lowered) if "currency" in candidates else None
 
     # thousand separator detection
-    if RE_THOUSAND_SPACE.search(text):
-        feats["thousand_sep_mode"] = "space"
-    elif RE_THOUSAND_DOT.search(text):
-        feats["thousand_sep_mode"] = "dot"
-    elif RE_THOUSAND_COMMA.search(text):
-        feats["thousand_sep_mode"] = "comma"
-    else:
-        feats["thousand_sep_mode"] = None
+    feats["thousand_sep_mode"] = detect_mode(THOUSAND_SEP_MODES, lowered) if has_digit and "thousand_sep" in candidates else None
 
     # unit detection
-    if RE_UNIT_WITH_QUANTITY.search(text):
-        feats["unit_mode"] = "short"
-    elif RE_UNIT_LONG.search(text):
-        feats["unit_mode"] = "long"
-    else:
-        feats["unit_mode"] = None
+    feats["unit_mode"] = detect_mode(UNIT_MODES, lowered) if "unit" in candidates else None
 
 
     # ordinal number style
-    feats["ordinal_style"] = detect_ordinal_style(text)
+    feats["ordinal_style"] = detect_ordinal_style(lowered, normalized=True) if "ordinal" in candidates else None
 
     # number style
-    feats["number_style"] = detect_number_style(text)
+    feats["number_style"] = detect_number_style(lowered, normalized=True) if "number" in candidates else None
 
     # hesitation markers
-    feats["hesitation_plain"] = any(re.search(pattern, text, re.I) for pattern in HESITATION_PATTERNS)
+    feats["hesitation_plain"] = "hesitation" in candidates and bool(RE_HESITATION_PATTERN.search(lowered))
 
     # text style features
     feats["punctuation"] = bool(RE_PUNCT.search(text))
-    letters = [c for c in text if c.isalpha()]
+    letters = "".join(filter(str.isalpha, text)) # filter/map with str methods run per character in C, not in bytecode
     feats["uppercase"] = (
-        sum(c.isupper() for c in letters)/len(letters)
+        sum(map(str.isupper, letters))/len(letters)
         if letters else 0
     )
 
     # date format
-    feats["date_format"] = detect_date_style(text)
+    feats["date_format"] = detect_date_style(lowered, normalized=True) if has_digit and "date" in candidates else None
 
 
     return feats
 
 
 
+def detect_mode(modes, text):
+    """
+    Searches the patterns of a feature category in priority order (e.g. UNIT_MODES)
+    and returns the name of the first one found anywhere in the text.
+
+    Returns:
+    - Name of the matched mode (e.g. 'symbol_space', 'dot', 'short')
+    - None if no pattern matches
+    """
+    for name, regex in modes:
+        if regex.search(text):
+            return name
+    return None
+
+
+
 # =================================
 # DOMINANT PATTERN ANALYSIS
 # =================================
@@ -260,27 +391,35 @@ def get_primary_convention_with_percentage(series):
     - (convention, percentage) tuple
     - ("not_detected", 0.0) if no conventions detected
     """
-    filtered = [x for x in series if x is not None]
-    if not filtered:
+    counts = series.value_counts(sort=False, dropna=True) # Conventions in order of first appearance
+    return get_primary_convention_from_counts(counts.to_dict())
+
+def get_primary_convention_from_counts(counts):
+    """
+    Same as get_primary_convention_with_percentage, from a {convention: count} dict
+    listing conventions in order of first appearance.
+    """
+    total = sum(counts.values())
+    if total == 0:
         return "not_detected", 0.0
 
-    counter = Counter(filtered)
-    most_common = counter.most_common(1)[0]
-    convention, count = most_common
-    percentage = count / len(filtered)
+    convention = max(counts, key=counts.get) # On ties, the first convention seen wins
+    percentage = counts[convention] / total
 
-    return convention, percentage
+    return convention, float(percentage)
 
-def detect_ordinal_style(text):
+def detect_ordinal_style(text, normalized=False):
     """
     Detects how ordinal numbers are formatted in the text.
+    Pass normalized=True when the text already went through normalize() and lower().
 
     Returns:
     - 'digit_suffix' for forms like 9e, 9ème, 5th, 3º
     - 'word' for written forms like "premier", "first"
     - None if no ordinal numbers are found
     """
-    text = normalize(text)
+    if not normalized:
+        text = normalize(text).lower()
     if RE_ORDINAL_DIGIT.search(text):
         return "digit_suffix"
     elif RE_ORDINAL_WORD.search(text):
@@ -288,48 +427,53 @@ def detect_ordinal_style(text):
     else:
         return None
 
-def detect_number_style(text):
+def detect_number_style(text, normalized=False):
   """
   Determines if numbers are represented as digits or written words.
   When both forms appear, returns the more frequent representation.
+  Pass normalized=True when the text already went through normalize() and lower().
 
   Returns:
   - 'digit' for numerical digits (e.g., 9, 100)
   - 'word' for written numbers (e.g., "nine", "ten")
   - None    : no numbers detected
   """
-  text = normalize(text)
-  has_digit = bool(re.search(r"\d+", text))
-  has_word_number = bool(re.search(RE_WORD_NUMBER, text, re.I))
-
-  if has_digit and not has_word_number:
+  if not normalized:
+      text = normalize(text).lower()
+  # Count both forms in a single pass: group 1 holds digit runs, any other match is a number word
+  digit_count = word_count = 0
+  for match in RE_NUMBER_OR_WORD.finditer(text):
+      if match.group(1):
+          digit_count += 1
+      else:
+          word_count += 1
+
+  if digit_count and not word_count:
       return "digit"
-  elif has_word_number and not has_digit:
+  elif word_count and not digit_count:
       return "word"
-  elif has_digit and has_word_number:
+  elif digit_count and word_count:
       # If both appear, choose the most frequent
-      digit_count = len(re.findall(r"\d+", text))
-      word_count = len(re.findall(RE_WORD_NUMBER, text, re.I))
       return "digit" if digit_count >= word_count else "word"
   else:
       return None
 
-def detect_date_style(text):
+def detect_date_style(text, normalized=False):
     """
-    Returns the most frequent date format among standard formats:
+    Returns the most frequent date format among standard formats
+    (pass normalized=True when the text already went through normalize() and lower()):
     - 'dd/mm/yyyy'    : day/month/year format (e.g., 25/11/2024)
     - 'yyyy-mm-dd'    : ISO year-month-day format (e.g., 2024-11-25)
     - 'dd_month_yyyy' : literal month format (e.g., 25 novembre 2024)
     - None            : if no dates are detected
     """
 
-    text = normalize(text)
+    if not normalized:
+        text = normalize(text).lower()
+    if not RE_DIGIT.search(text): # No date format can match without digits
+        return None
 
-    counts = {
-        "dd/mm/yyyy": len(RE_DATE_DD_MM_YYYY.findall(text)),
-        "yyyy-mm-dd": len(RE_DATE_YYYY_MM_DD.findall(text)),
-        "dd_month_yyyy": len(RE_DATE_DD_MONTH_YYYY.findall(text)),
-    }
+    counts = {name: sum(1 for _ in regex.finditer(text)) for name, regex in DATE_FORMATS}
 
     total = sum(counts.values())
     if total == 0:
@@ -341,6 +485,126 @@ def detect_date_style(text):
 # DATASET ANALYSIS
 # =============================
 
+def map_model_columns(columns, model_names):
+    """
+    Maps each transcription column to the first model name contained in its (lowercased) name.
+    Columns that match no model are left out.
+    """
+    col_to_model = {}
+    for col in columns:
+        col_lower = col.lower()
+        for model in model_names:
+            if model in col_lower:
+                col_to_model[col] = model
+                break
+    return col_to_model
+
+CSV_CHUNK_ROWS = 50_000 # Rows per chunk when streaming large CSV files
+STREAM_MIN_BYTES = 100 * 1024**2 # Files larger than this are streamed instead of loaded at once
+
+def read_transcriptions(path):
+    """
+    Reads a transcription CSV with every column as text, yielding it as one or more DataFrames.
+
+    Files up to STREAM_MIN_BYTES are read at once; larger files are streamed in chunks
+    of CSV_CHUNK_ROWS rows to bound memory. Both use pandas' default parser, so empty
+    and "NA"-like cells stay missing and numeric-looking cells keep their text.
+    """
+    if os.path.getsize(path) > STREAM_MIN_BYTES:
+        yield from pd.read_csv(path, dtype=str, chunksize=CSV_CHUNK_ROWS)
+        return
+
+    yield pd.read_csv(path, dtype=str)
+
+# Convention columns produced by detect(): a handful of distinct values each, stored as categoricals
+CONVENTION_FEATURES = ["currency_mode", "date_format", "thousand_sep_mode", "percent_mode", "unit_mode", "ordinal_style", "number_style"]
+
+PARALLEL_MIN_ROWS = 1000 # Below this size, starting worker processes costs more than it saves
+
+def detect_all(texts, pool=None):
+    """
+    Runs detect() on every text. Rows are independent, so large inputs are spread
+    over the given process pool; small ones (or calls without a pool) are processed serially.
+
+    Returns: list of feature dicts, in the same order as texts
+    """
+    texts = list(texts)
+    if pool is None or len(texts) < PARALLEL_MIN_ROWS:
+        return [detect(t) for t in texts]
+    return pool.map(detect, texts, chunksize=256)
+
+def submit_series(texts, get_pool=None):
+    """
+    Starts detect() on the distinct texts of a Series of transcriptions.
+    get_pool returns the process pool and is only called for large inputs, so the pool
+    can be created on first use. Those inputs are sent to the workers without waiting,
+    so the caller can read the next chunk meanwhile; finish with features_frame().
+
+    Returns: (row codes into the distinct texts, feature dicts or pending pool result)
+    """
+    codes, uniques = pd.factorize(texts.fillna(""), use_na_sentinel=False) # Missing rows are empty transcriptions
+    if get_pool is None or len(uniques) < PARALLEL_MIN_ROWS:
+        return codes, detect_all(uniques)
+    return codes, get_pool().map_async(detect, uniques, chunksize=256)
+
+def features_frame(codes, features):
+    """
+    Builds the feature DataFrame (one row per text, one column per feature) from submit_series().
+    Each distinct text was analyzed once; its features are broadcast back to every
+    row holding it with a single positional take.
+    """
+    if not isinstance(features, list):
+        features = features.get()
+    unique_feats = pd.DataFrame(features)
+    for column in CONVENTION_FEATURES:
+        # Categories listed in order of first appearance, so that ties in value_counts(sort=False) resolve as before
+        values = unique_feats[column]
+        unique_feats[column] = pd.Categorical(values, categories=values.dropna().unique())
+    return unique_feats.iloc[codes].reset_index(drop=True)
+
+def detect_series(texts, pool=None):
+    """
+    Runs detect() on a Series of transcriptions and returns the features as a DataFrame
+    (one row per text, one column per feature).
+    """
+    return features_frame(*submit_series(texts, None if pool is None else lambda: pool))
+
+# Text style metrics produced by detect(), averaged over all rows
+STYLE_FEATURES = ["uppercase", "punctuation", "hesitation_plain"]
+
+def new_aggregates():
+    """
+    Returns empty running aggregates for one transcription column: per convention feature,
+    value counts in order of first appearance; per style feature, the sum over rows.
+    """
+    return {
+        "conventions": {feature: {} for feature in CONVENTION_FEATURES},
+        "sums": dict.fromkeys(STYLE_FEATURES, 0.0),
+        "rows": 0,
+    }
+
+def add_to_aggregates(aggregates, codes, features):
+    """
+    Folds one chunk from submit_series() into the running aggregates of its column.
+    Features are weighted by how many rows hold each distinct text; no per-row frame is built.
+    """
+    if not isinstance(features, list):
+        features = features.get()
+    if not features:
+        return
+    unique_feats = pd.DataFrame(features)
+    occurrences = pd.Series(np.bincount(codes, minlength=len(unique_feats)))
+
+    for feature, counts in aggregates["conventions"].items():
+        # Distinct texts are in order of first appearance, and groupby(sort=False) keeps that order
+        for value, count in occurrences.groupby(unique_feats[feature], sort=False).sum().items():
+            counts[value] = counts.get(value, 0) + int(count)
+    for feature in STYLE_FEATURES:
+        aggregates["sums"][feature] += float(unique_feats[feature].astype(float) @ occurrences)
+    aggregates["rows"] += len(codes)
+
+MAX_PENDING_CHUNKS = 2 # Chunks submitted to the pool before waiting on the oldest one
+
 def analyze():
     """
     Main function for analyzing transcription datasets.
@@ -361,57 +625,72 @@ def analyze():
     model_names = ["whisper","canary","parakeet"]
     results = []
 
-    for f in files:
-        df = pd.read_csv(f, dtype=str)
-        filename = Path(f).name
-
-        for col in df.columns:
-            if not any(m in col.lower() for m in model_names):
-                continue
-
-            model = [m for m in model_names if m in col.lower()][0]
-
-            all_feats = [detect(t) for t in df[col]]
-            feat_df = pd.DataFrame(all_feats)
-
-            # Get conventions with their percentages
-            currency_convention, currency_pct = get_primary_convention_with_percentage(feat_df["currency_mode"])
-            date_convention, date_pct = get_primary_convention_with_percentage(feat_df["date_format"])
-            thousand_convention, thousand_pct = get_primary_convention_with_percentage(feat_df["thousand_sep_mode"])
-            percent_convention, percent_pct = get_primary_convention_with_percentage(feat_df["percent_mode"])
-            unit_convention, unit_pct = get_primary_convention_with_percentage(feat_df["unit_mode"])
-            ordinal_convention, ordinal_pct = get_primary_convention_with_percentage(feat_df["ordinal_style"])
-            number_convention, number_pct = get_primary_convention_with_percentage(feat_df["number_style"])
-
-            row = {
-                "file": filename,
-                "model": model,
-
-                # Convention values
-                "currency_format": currency_convention,
-                "date_format": date_convention,
-                "thousand_separator_format": thousand_convention,
-                "percent_format": percent_convention,
-                "unit_format": unit_convention,
-                "ordinal_style": ordinal_convention,
-                "number_style": number_convention,
-
-                # Convention percentages
-                "currency_majority_pct": currency_pct,
-                "date_majority_pct": date_pct,
-                "thousand_separator_majority_pct": thousand_pct,
-                "percent_majority_pct": percent_pct,
-                "unit_majority_pct": unit_pct,
-                "ordinal_majority_pct": ordinal_pct,
-                "number_majority_pct": number_pct,
-
-                # Text style metrics
-                "uppercase_frequency": feat_df["uppercase"].mean(),
-                "punctuation_frequency": feat_df["punctuation"].mean(),
-                "hesitation_frequency": feat_df["hesitation_plain"].mean(),
-            }
-
-            results.append(row)
+    # One pool for the whole run, started by the first column large enough to need it:
+    # workers are started once, not per chunk or column, and never for small datasets
+    with ExitStack() as stack:
+        get_pool = lru_cache(maxsize=None)(lambda: stack.enter_context(Pool()))
+        for f in files:
+            # Detection of a chunk runs in the workers while the next chunk is read.
+            # Each finished chunk is folded into per-column aggregates and dropped, so memory
+            # stays bounded by MAX_PENDING_CHUNKS chunks whatever the file size.
+            col_to_model = {}
+            aggregates = {}
+            pending = deque()
+            for i, chunk in enumerate(read_transcriptions(f)):
+                if i == 0: # All chunks share the header
+                    col_to_model = map_model_columns(chunk.columns, model_names)
+                    aggregates = {col: new_aggregates() for col in col_to_model}
+                pending.append([(col, submit_series(chunk[col], get_pool)) for col in col_to_model])
+                while len(pending) > MAX_PENDING_CHUNKS:
+                    for col, part in pending.popleft():
+                        add_to_aggregates(aggregates[col], *part)
+            while pending:
+                for col, part in pending.popleft():
+                    add_to_aggregates(aggregates[col], *part)
+
+            filename = Path(f).name
+            for col, model in col_to_model.items():
+                conventions = aggregates[col]["conventions"]
+                sums, rows = aggregates[col]["sums"], aggregates[col]["rows"]
+
+                # Get conventions with their percentages
+                currency_convention, currency_pct = get_primary_convention_from_counts(conventions["currency_mode"])
+                date_convention, date_pct = get_primary_convention_from_counts(conventions["date_format"])
+                thousand_convention, thousand_pct = get_primary_convention_from_counts(conventions["thousand_sep_mode"])
+                percent_convention, percent_pct = get_primary_convention_from_counts(conventions["percent_mode"])
+                unit_convention, unit_pct = get_primary_convention_from_counts(conventions["unit_mode"])
+                ordinal_convention, ordinal_pct = get_primary_convention_from_counts(conventions["ordinal_style"])
+                number_convention, number_pct = get_primary_convention_from_counts(conventions["number_style"])
+
+                row = {
+                    "file": filename,
+                    "model": model,
+
+                    # Convention values
+                    "currency_format": currency_convention,
+                    "date_format": date_convention,
+                    "thousand_separator_format": thousand_convention,
+                    "percent_format": percent_convention,
+                    "unit_format": unit_convention,
+                    "ordinal_style": ordinal_convention,
+                    "number_style": number_convention,
+
+                    # Convention percentages
+                    "currency_majority_pct": currency_pct,
+                    "date_majority_pct": date_pct,
+                    "thousand_separator_majority_pct": thousand_pct,
+                    "percent_majority_pct": percent_pct,
+                    "unit_majority_pct": unit_pct,
+                    "ordinal_majority_pct": ordinal_pct,
+                    "number_majority_pct": number_pct,
+
+                    # Text style metrics
+                    "uppercase_frequency": sums["uppercase"] / rows,
+                    "punctuation_frequency": sums["punctuation"] / rows,
+                    "hesitation_frequency": sums["hesitation_plain"] / rows,
+                }
+
+                results.append(row)
 
     pd.DataFrame(results).to_csv("model_conventions_summary.csv", index=False)
     print("Saved as model_conventions_summary.csv")